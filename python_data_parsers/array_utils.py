@@ -0,0 +1,121 @@
+""" Utilities for arrays of data. """
+
+import numpy as np
+
+EMPTY_ARRAY_FILL = -1717.0
+MAX_WALK_STEPS = 4
+
+
+def walk_sorted_index(xdata: np.ndarray, value: float, idx: int, side: str) -> int:
+    """
+    Move a previous searchsorted index to its position for a new value.
+
+    When the value has only moved by a sample or two, walking the previous
+    index is cheaper than a binary search. The index is walked at most
+    MAX_WALK_STEPS entries before falling back to np.searchsorted.
+
+    Parameters
+    ----------
+    xdata: np.ndarray
+        Sorted reference data array
+    value: float
+        Value to locate in xdata
+    idx: int
+        Previous index returned for this bound
+    side: str
+        Either "left" or "right", with the same meaning as in np.searchsorted
+
+    Returns
+    -------
+    idx: int
+        Index equal to np.searchsorted(xdata, value, side=side)
+
+    """
+    size = xdata.shape[0]
+    for _ in range(MAX_WALK_STEPS):
+        if side == "left":
+            if idx > 0 and xdata[idx - 1] >= value:
+                idx -= 1
+            elif idx < size and xdata[idx] < value:
+                idx += 1
+            else:
+                return idx
+        else:
+            if idx > 0 and xdata[idx - 1] > value:
+                idx -= 1
+            elif idx < size and xdata[idx] <= value:
+                idx += 1
+            else:
+                return idx
+
+    return int(np.searchsorted(xdata, value, side=side))
+
+
+def stack_arrays(array_list: list[np.ndarray], stack_single: bool = True) -> np.ndarray:
+    """
+    Stack a list of equally shaped arrays along a new first axis.
+
+    Leading empty arrays are dropped. Later empty arrays are replaced by an
+    array of EMPTY_ARRAY_FILL with the shape of the first non-empty array.
+
+    Parameters
+    ----------
+    array_list: list[np.ndarray]
+        Arrays to stack, possibly containing empty arrays
+    stack_single: bool
+        If False and only one array remains after dropping leading empty
+        arrays, that array is returned without adding the new axis
+
+    Returns
+    -------
+    np.ndarray
+        Stacked array, or None if every array is empty
+
+    """
+    fill_shape = None
+    filled_list = []
+    for np_array in array_list:
+        if np_array.size != 0:
+            if fill_shape is None:
+                fill_shape = np_array.shape
+        elif fill_shape is None:
+            continue
+        else:
+            np_array = np.full(fill_shape, EMPTY_ARRAY_FILL)
+
+        filled_list.append(np_array)
+
+    if not filled_list:
+        return None
+
+    if len(filled_list) == 1 and not stack_single:
+        return filled_list[0]
+
+    return np.stack(filled_list)
+
+
+def combine_time_stamps(stamp_list: list[tuple[int, int]]) -> np.ndarray:
+    """
+    Convert (sec, nanosec) time stamp pairs into seconds.
+
+    Parameters
+    ----------
+    stamp_list: list[tuple[int, int]]
+        Time stamp pairs of whole seconds and nanoseconds
+
+    Returns
+    -------
+    np.ndarray
+        Time stamps in seconds
+
+    """
+    count = len(stamp_list)
+    secs = np.fromiter((sec for sec, _ in stamp_list), dtype=np.float64, count=count)
+    stamps = np.fromiter(
+        (nsec for _, nsec in stamp_list), dtype=np.float64, count=count
+    )
+
+    # Combine in place so that no temporary arrays are allocated.
+    stamps *= 1e-9
+    stamps += secs
+    return stamps
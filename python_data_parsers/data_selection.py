@@ -10,12 +10,19 @@ from dataclasses import InitVar, dataclass, field
 from typing import Any, Protocol
 
 import numpy as np
-from matplotlib import axis, figure, lines
+from matplotlib import axis, backend_bases, figure, lines
 from matplotlib.backends.backend_gtk3agg import FigureCanvasGTK3Agg as FigureCanvas
 
+from .array_utils import walk_sorted_index
+
 
 def trim_data_to_bounds(
-    xdata: np.ndarray, ydata: np.ndarray, lower: float, upper: float, axis: int = 0
+    xdata: np.ndarray,
+    ydata: np.ndarray,
+    lower: float,
+    upper: float,
+    axis: int = 0,
+    monotonic: bool = False,
 ) -> tuple[np.ndarray, np.ndarray]:
     """
     Trims data to selected boundaries.
@@ -37,6 +44,10 @@ def trim_data_to_bounds(
         Upper bound on allowable xdata values
     axis: int
         Axis along which to trim values
+    monotonic: bool
+        If True, xdata is assumed to be sorted in ascending order and the
+        bounds are located by binary search. The returned arrays are then
+        views into the original data rather than copies.
 
     Returns
     -------
@@ -46,10 +57,17 @@ def trim_data_to_bounds(
         Trimmed ydata array
 
     """
-    idx, *_ = np.where(np.logical_and(xdata >= lower, xdata <= upper))
-    xtrim = xdata[idx]
-    ytrim = np.take(ydata, idx, axis=axis)
-    return xtrim, ytrim
+    if monotonic:
+        lo = np.searchsorted(xdata, lower, side="left")
+        hi = np.searchsorted(xdata, upper, side="right")
+        yslice = (slice(None),) * (axis % ydata.ndim) + (slice(lo, hi),)
+        return xdata[lo:hi], ydata[yslice]
+
+    mask = (xdata >= lower) & (xdata <= upper)
+    if axis == 0:
+        return xdata[mask], ydata[mask]
+
+    return xdata[mask], np.compress(mask, ydata, axis=axis)
 
 
 @dataclass
@@ -58,14 +76,21 @@ class SelectionPlotter(abc.ABC):
     Base class implementation of a selection plotter.
 
     This class's children are designed to be used with the data selection
-    dialog class.
+    dialog class. Children must create _highlight_plot with animated=True so
+    that it can be blitted over the cached figure background. Since animated
+    artists are skipped by Figure.draw, figures saved from the dialog toolbar
+    do not include the selection highlight.
 
     """
 
     _figure: figure.Figure = field(init=False)
     _canvas: FigureCanvas = field(init=False)
+    _background: Any = field(init=False, repr=False)
+    _highlight_plot: lines.Line2D = field(init=False)
     _lower_bound: float = field(init=False)
     _upper_bound: float = field(init=False)
+    _lower_idx: int = field(init=False)
+    _upper_idx: int = field(init=False)
 
     @property
     @abc.abstractmethod
@@ -148,13 +173,59 @@ class SelectionPlotter(abc.ABC):
         """
         Redraw plot when data bounds are updated.
 
-        Calls the user-defined _update_plot() method and then redraws the canvas.
+        Calls the user-defined _update_plot() method and then blits the
+        highlight over the cached figure background. A full canvas draw is
+        only done if no background has been cached yet.
 
         """
         self._update_plot()
-        self._canvas.draw()
+
+        if self._background is None:
+            self._canvas.draw()
+        else:
+            self._canvas.restore_region(self._background)
+            self._figure.draw_artist(self._highlight_plot)
+            self._canvas.blit(self._figure.bbox)
+
         self._canvas.flush_events()
 
+    def _get_bounds_slice(self, xdata: np.ndarray) -> slice:
+        """
+        Get slice of sorted data lying within the current bounds.
+
+        The bound indices from the previous call are reused as the starting
+        point, so a single step of the bounds only costs a few comparisons.
+
+        Parameters
+        ----------
+        xdata: np.ndarray
+            Sorted reference data array
+
+        Returns
+        -------
+        select: slice
+            Slice of xdata within the current bounds
+
+        """
+        self._lower_idx = walk_sorted_index(
+            xdata=xdata, value=self.lower_bound, idx=self._lower_idx, side="left"
+        )
+        self._upper_idx = walk_sorted_index(
+            xdata=xdata, value=self.upper_bound, idx=self._upper_idx, side="right"
+        )
+        return slice(self._lower_idx, self._upper_idx)
+
+    def _on_draw(self, event: backend_bases.DrawEvent) -> None:
+        """Cache the figure background after every full canvas draw."""
+        # Saving the figure fires draw events, either from the format's own
+        # canvas or from this canvas at the save size. Neither may replace the
+        # cached background or draw the highlight into the saved figure.
+        if event.canvas is not self._canvas or self._canvas.is_saving():
+            return
+
+        self._background = self._canvas.copy_from_bbox(self._figure.bbox)
+        self._figure.draw_artist(self._highlight_plot)
+
     def update_bounds(self, lower: float, upper: float) -> None:
         """
         Update current data bounds.
@@ -169,6 +240,9 @@ class SelectionPlotter(abc.ABC):
         upper: float
             Desired upper bound
         """
+        if lower == self._lower_bound and upper == self._upper_bound:
+            return
+
         self._lower_bound = lower
         self._upper_bound = upper
 
@@ -179,6 +253,8 @@ class SelectionPlotter(abc.ABC):
         self._figure = figure.Figure(tight_layout=True)
         self._canvas = FigureCanvas(self._figure)
         self._canvas.set_size_request(800, 600)
+        self._background = None
+        self._canvas.mpl_connect("draw_event", self._on_draw)
 
         self._lower_bound = self.data_lower_bound
         self._upper_bound = self.data_upper_bound
@@ -220,8 +296,6 @@ class PathDistanceSelectionPlotter(SelectionPlotter):
     plot_kwargs: InitVar[dict[str, Any]] = None
     axis_kwargs: InitVar[dict[str, Any]] = None
 
-    _highlight_plot: lines.Line2D = field(init=False)
-
     @property
     def data_lower_bound(self):
         return self.min_s
@@ -231,19 +305,10 @@ class PathDistanceSelectionPlotter(SelectionPlotter):
         return self.max_s
 
     def _update_plot(self) -> None:
-        _, east_select = trim_data_to_bounds(
-            xdata=self.world.s_m,
-            ydata=self.world.east_m,
-            lower=self.lower_bound,
-            upper=self.upper_bound,
+        select = self._get_bounds_slice(self.world.s_m)
+        self._highlight_plot.set_data(
+            self.world.east_m[select], self.world.north_m[select]
         )
-        _, north_select = trim_data_to_bounds(
-            xdata=self.world.s_m,
-            ydata=self.world.north_m,
-            lower=self.lower_bound,
-            upper=self.upper_bound,
-        )
-        self._highlight_plot.set_data(east_select, north_select)
 
     def __post_init__(
         self,
@@ -254,12 +319,16 @@ class PathDistanceSelectionPlotter(SelectionPlotter):
         axis_kwargs: dict[str, Any],
     ) -> None:
         if s_data is None:
-            self.min_s = np.min(self.world.s_m)
-            self.max_s = np.max(self.world.s_m)
+            # Path distance is sorted, so its extremes are its end points.
+            self.min_s = self.world.s_m[0]
+            self.max_s = self.world.s_m[-1]
         else:
             self.min_s = np.min(s_data)
             self.max_s = np.max(s_data)
 
+        self._lower_idx = 0
+        self._upper_idx = self.world.s_m.shape[0]
+
         super().__post_init__()
         ax = self._figure.add_subplot()
 
@@ -267,9 +336,7 @@ class PathDistanceSelectionPlotter(SelectionPlotter):
             plot_kwargs = {}
         self.world.plot(ax=ax, **plot_kwargs)
 
-        (self._highlight_plot,) = ax.plot(
-            self.world.east_m, self.world.north_m, "r-", linewidth=2
-        )
+        (self._highlight_plot,) = ax.plot([], [], "r-", linewidth=2, animated=True)
 
         if axis_kwargs is None:
             axis_kwargs = {}
@@ -300,28 +367,39 @@ class TimeSeriesPlotter(SelectionPlotter):
     ylabel: InitVar[str]
     ylim: InitVar[tuple[float, float]] = None
 
-    _highlight_plot: lines.Line2D = field(init=False)
+    _sorted_xdata: np.ndarray = field(init=False, repr=False)
+    _sorted_ydata: np.ndarray = field(init=False, repr=False)
 
     @property
     def data_lower_bound(self):
-        return np.min(self.xdata)
+        return self._sorted_xdata[0]
 
     @property
     def data_upper_bound(self):
-        return np.max(self.xdata)
+        return self._sorted_xdata[-1]
 
     def _update_plot(self) -> None:
-        xdata_select, ydata_select = trim_data_to_bounds(
-            xdata=self.xdata,
-            ydata=self.ydata,
-            lower=self.lower_bound,
-            upper=self.upper_bound,
+        select = self._get_bounds_slice(self._sorted_xdata)
+        self._highlight_plot.set_data(
+            self._sorted_xdata[select], self._sorted_ydata[select]
         )
-        self._highlight_plot.set_data(xdata_select, ydata_select)
 
     def __post_init__(
         self, xlabel: str, ylabel: str, ylim: tuple[float, float]
     ) -> None:
+        # Selection slices into time-sorted data, so sort once up front if the
+        # samples are out of order.
+        if np.any(np.diff(self.xdata) < 0):
+            sort_idx = np.argsort(self.xdata, kind="stable")
+            self._sorted_xdata = self.xdata[sort_idx]
+            self._sorted_ydata = self.ydata[sort_idx]
+        else:
+            self._sorted_xdata = self.xdata
+            self._sorted_ydata = self.ydata
+
+        self._lower_idx = 0
+        self._upper_idx = self.xdata.shape[0]
+
         super().__post_init__()
         ax = self._figure.add_subplot()
         ax.plot(self.xdata, self.ydata, "k-")
@@ -335,5 +413,7 @@ class TimeSeriesPlotter(SelectionPlotter):
         ax.grid(True)
 
         (self._highlight_plot,) = ax.plot(
-            self.xdata, self.ydata, "r-", linewidth=8, alpha=0.6
+            [], [], "r-", linewidth=8, alpha=0.6, animated=True
         )
+
+        self._update_plot()
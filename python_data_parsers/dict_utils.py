@@ -9,6 +9,7 @@ from . import units
 _DATA_DICT = dict[str, np.ndarray]
 _RAD_STR = "_rad"
 _DEG_STR = "_deg"
+_RAD_TO_DEG = 180.0 / np.pi
 
 
 class SharedKeyError(Exception):
@@ -36,11 +37,7 @@ def dict_to_3d_array(results: dict[str, np.ndarray]) -> np.ndarray:
         3d array of values
 
     """
-    val_list = []
-    for val in results.values():
-        val_list.append(np.expand_dims(val.T, axis=0))
-
-    return np.concatenate(val_list, axis=0)
+    return np.stack([val.T for val in results.values()], axis=0)
 
 
 def add_first_timestamps(data: _DATA_DICT) -> _DATA_DICT:
@@ -125,10 +122,42 @@ def add_deg_keys_from_rad(data: _DATA_DICT) -> _DATA_DICT:
     out_dict = {}
     for key, val in data.items():
         if _RAD_STR in key:
-            out_dict[key.replace(_RAD_STR, _DEG_STR)] = np.degrees(val)
+            out_dict[key.replace(_RAD_STR, _DEG_STR)] = val * _RAD_TO_DEG
     return out_dict | data
 
 
+def build_derived_keys(data: _DATA_DICT) -> _DATA_DICT:
+    """
+    Add SI base and degree signals to a dictionary in a single pass.
+
+    This is equivalent to calling add_si_base_keys_to_dict followed by
+    add_deg_keys_from_rad, but only walks the dictionary once. Original
+    entries take precedence over derived entries with the same key.
+
+    Parameters
+    ----------
+    data: _DATA_DICT
+        Dictionary containing signal values
+
+    Returns
+    -------
+    _DATA_DICT
+        Dictionary containing original, SI base and degree signal values
+
+    """
+    out_dict = dict(data)
+    for key, val in data.items():
+        base_val, base_key = units.si_prefix_to_base_from_str(name=key, value=val)
+        out_dict.setdefault(base_key, base_val)
+
+        for rad_key, rad_val in ((key, val), (base_key, base_val)):
+            deg_key = rad_key.replace(_RAD_STR, _DEG_STR)
+            if _RAD_STR in rad_key and deg_key not in out_dict:
+                out_dict[deg_key] = rad_val * _RAD_TO_DEG
+
+    return out_dict
+
+
 def preprocess_data(data_tuple: tuple[_DATA_DICT]) -> _DATA_DICT:
     """
     Apply convert_to_SI_base and add_deg_from_rad to data.
@@ -144,13 +173,7 @@ def preprocess_data(data_tuple: tuple[_DATA_DICT]) -> _DATA_DICT:
         Tuple with processed data dictionaries
 
     """
-    new_data = []
-    for elem in data_tuple:
-        new_elem = add_si_base_keys_to_dict(elem)
-        new_elem = add_deg_keys_from_rad(elem)
-        new_data.append(new_elem)
-
-    return new_data
+    return [build_derived_keys(elem) for elem in data_tuple]
 
 
 def merge_dictionaries(dict_tuple: Iterable[_DATA_DICT]) -> _DATA_DICT:
@@ -168,14 +191,11 @@ def merge_dictionaries(dict_tuple: Iterable[_DATA_DICT]) -> _DATA_DICT:
         Iterable of dictionaries to merge
 
     """
-    set_list = [set(elem.keys()) for elem in dict_tuple]
-    set_lengths = [len(elem) for elem in set_list]
-
-    if not len(set.union(*set_list)) == sum(set_lengths):
-        raise SharedKeyError("Two or more dictionaries share at least one key.")
-
     out_dict = {}
     for elem in dict_tuple:
-        out_dict |= elem
+        if not out_dict.keys().isdisjoint(elem):
+            raise SharedKeyError("Two or more dictionaries share at least one key.")
+
+        out_dict.update(elem)
 
     return out_dict
@@ -1,7 +1,8 @@
 import array
+from functools import partial
 from numbers import Number
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import numpy as np
 import rosbag2_py
@@ -11,80 +12,109 @@ from rclpy.serialization import deserialize_message
 from rosidl_runtime_py.utilities import get_message
 from std_msgs.msg import Header
 
+from .array_utils import combine_time_stamps, stack_arrays
+
 PACKAGE_DIR = Path(__file__).parent.parent
 ROSBAG_DIR = PACKAGE_DIR.joinpath("rosbags")
 
 
 def squeeze_numpy_fields(in_dict: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
     for key, value in in_dict.items():
-        in_dict[key] = value.squeeze()
+        if 1 in value.shape:
+            in_dict[key] = value.squeeze()
 
     return in_dict
 
 
-def parse_scalar(value: Number, in_array: np.ndarray) -> np.ndarray:
-    if in_array is None:
-        return np.array([value])
-
-    return np.append(in_array, value)
-
+def parse_scalar(value: Number, in_list: list[Number]) -> list[Number]:
+    if in_list is None:
+        in_list = []
 
-def parse_time_stamp(header: Header, in_array: np.ndarray) -> np.ndarray:
-    secs = header.stamp.sec
-    nsecs = header.stamp.nanosec
-    stamp = secs + (nsecs * 1e-9)
+    in_list.append(value)
+    return in_list
 
-    return parse_scalar(stamp, in_array=in_array)
 
+def parse_time_stamp(
+    header: Header, in_list: list[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    if in_list is None:
+        in_list = []
 
-def parse_array(value_array: array.array, in_array: np.ndarray) -> np.ndarray:
-    np_array = np.array(value_array)
+    in_list.append((header.stamp.sec, header.stamp.nanosec))
+    return in_list
 
-    if in_array is None and np_array.size == 0:
-        return None
-    elif in_array is None:
-        return np_array
-    elif np_array.size == 0:
-        np_array = -1717.0 * np.ones(in_array.shape[1:])
 
-    return np.row_stack((in_array, np_array))
+def parse_array(value_array: array.array, in_list: list[array.array]) -> list:
+    if in_list is None:
+        in_list = []
 
+    in_list.append(value_array)
+    return in_list
 
-def parse_ndarray(value_ndarray: NDArray, in_ndarray: np.ndarray) -> np.ndarray:
-    np_array = conversion.msg_to_array(value_ndarray)
 
-    if in_ndarray is None and np_array.size == 0:
-        return None
-    if in_ndarray is None:
-        return np_array[np.newaxis, ...]
-    elif np_array.size == 0:
-        np_array = -1717.0 * np.ones(in_ndarray.shape[1:])
+def parse_ndarray(value_ndarray: NDArray, in_list: list[np.ndarray]) -> list:
+    if in_list is None:
+        in_list = []
 
-    return np.append(in_ndarray, np_array[np.newaxis, ...], axis=0)
+    in_list.append(conversion.msg_to_array(value_ndarray))
+    return in_list
 
 
-def parse_message(msg, in_dict: dict[str, Any]) -> dict[str, Any]:
-    if in_dict is None:
-        in_dict = {}
-
+def build_field_parsers(msg) -> list[tuple[str, str, Callable]]:
+    # ROS message fields have static types, so the parser for each field is
+    # chosen once from a sample message and reused for every later message.
+    field_parsers = []
     for field in msg.get_fields_and_field_types().keys():
         raw_val = getattr(msg, field)
-        old_entry = in_dict.get(field, None)
 
         if isinstance(raw_val, Header):
-            field = "stamp_s"
-            old_entry = in_dict.get(field, None)
-            val = parse_time_stamp(header=raw_val, in_array=old_entry)
+            field_parsers.append((field, "stamp_s", parse_time_stamp))
         elif isinstance(raw_val, Number):
-            val = parse_scalar(value=raw_val, in_array=old_entry)
+            field_parsers.append((field, field, parse_scalar))
         elif isinstance(raw_val, array.array):
-            val = parse_array(value_array=raw_val, in_array=old_entry)
+            field_parsers.append((field, field, parse_array))
         elif isinstance(raw_val, NDArray):
-            val = parse_ndarray(value_ndarray=raw_val, in_ndarray=old_entry)
+            field_parsers.append((field, field, parse_ndarray))
         else:
-            val = parse_message(raw_val, old_entry)
+            sub_parsers = build_field_parsers(raw_val)
+            parser = partial(parse_message, field_parsers=sub_parsers)
+            field_parsers.append((field, field, parser))
+
+    return field_parsers
+
 
-        in_dict[field] = val
+def parse_message(
+    msg,
+    in_dict: dict[str, Any],
+    field_parsers: list[tuple[str, str, Callable]] = None,
+) -> dict[str, Any]:
+    if in_dict is None:
+        in_dict = {}
+
+    if field_parsers is None:
+        field_parsers = build_field_parsers(msg)
+
+    for field, out_field, parser in field_parsers:
+        in_dict[out_field] = parser(getattr(msg, field), in_dict.get(out_field))
+
+    return in_dict
+
+
+def finalize_message(in_dict: dict[str, Any]) -> dict[str, Any]:
+    for field, val in in_dict.items():
+        if isinstance(val, dict):
+            in_dict[field] = finalize_message(val)
+        elif isinstance(val[0], tuple):
+            in_dict[field] = combine_time_stamps(val)
+        elif isinstance(val[0], array.array):
+            # View each array's buffer directly, the data is copied once when
+            # stacked. A single array is kept 1-D, as parse_array used to do.
+            np_arrays = [np.frombuffer(elem, dtype=elem.typecode) for elem in val]
+            in_dict[field] = stack_arrays(np_arrays, stack_single=False)
+        elif isinstance(val[0], np.ndarray):
+            in_dict[field] = stack_arrays(val)
+        else:
+            in_dict[field] = np.array(val)
 
     return in_dict
 
@@ -99,20 +129,31 @@ def parse_topics(
     topic_types = reader.get_all_topics_and_types()
     type_map = {topic.name: topic.type for topic in topic_types}
 
+    msg_type_map = {}
+    field_parser_map = {}
     ros_data_dict = {}
 
     while reader.has_next():
         topic, data, _ = reader.read_next()
 
-        msg_type = get_message(type_map[topic])
-        msg = deserialize_message(data, msg_type)
+        if topic not in msg_type_map:
+            msg_type_map[topic] = get_message(type_map[topic])
+
+        msg = deserialize_message(data, msg_type_map[topic])
+
+        if topic not in field_parser_map:
+            field_parser_map[topic] = build_field_parsers(msg)
+            ros_data_dict[topic] = {}
 
-        try:
-            ros_data_dict[topic] = parse_message(msg=msg, in_dict=ros_data_dict[topic])
-        except KeyError:
-            ros_data_dict[topic] = parse_message(msg=msg, in_dict={})
+        parse_message(
+            msg=msg,
+            in_dict=ros_data_dict[topic],
+            field_parsers=field_parser_map[topic],
+        )
 
-    return ros_data_dict
+    return {
+        topic: finalize_message(in_dict) for topic, in_dict in ros_data_dict.items()
+    }
 
 
 def parse_rosbag(rosbag_path: Path) -> dict[str, dict]:
@@ -1,4 +1,6 @@
+import re
 from enum import Enum, unique
+from functools import cache
 from numbers import Number
 from typing import Any
 
@@ -20,6 +22,25 @@ class SI_PREFIX(Enum):
     NANO = 1e-9
 
 
+_PREFIX_MULT = {item.name.lower(): item.value for item in SI_PREFIX}
+_PREFIX_ORDER = {prefix: idx for idx, prefix in enumerate(_PREFIX_MULT)}
+_PREFIX_RE = re.compile("|".join(_PREFIX_MULT))
+
+
+@cache
+def _split_si_prefix(name: str) -> tuple[float | None, str]:
+    # Signal names repeat across topics and data sets, so each distinct name
+    # is only searched once.
+    # If several prefixes occur in the name, the one listed last in SI_PREFIX
+    # is used. No two prefix names overlap, so findall sees all of them.
+    matches = _PREFIX_RE.findall(name)
+    if not matches:
+        return None, name
+
+    prefix = max(matches, key=_PREFIX_ORDER.__getitem__)
+    return _PREFIX_MULT[prefix], name.replace(prefix, "")
+
+
 def si_prefix_to_base_from_str(name: str, value: Any) -> tuple[Any, str]:
     """
     Convert given name and value to SI base units.
@@ -39,19 +60,11 @@ def si_prefix_to_base_from_str(name: str, value: Any) -> tuple[Any, str]:
         Name in SI base units
 
     """
-    prefix = None
-    multiplier = 1.0
-    for item in SI_PREFIX:
-        if item.name.lower() not in name:
-            continue
-
-        prefix = item.name.lower()
-        multiplier = item.value
-
-    if prefix is None:
+    multiplier, base_name = _split_si_prefix(name)
+    if multiplier is None:
         return value, name
 
-    return value * multiplier, name.replace(prefix, "")
+    return value * multiplier, base_name
 
 
 def si_prefix_to_base(prefix: SI_PREFIX, value: Any) -> tuple[Any, str]:
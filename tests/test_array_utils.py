@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from python_data_parsers import array_utils
+
+
+@pytest.mark.parametrize("side", ["left", "right"])
+def test_walk_sorted_index_matches_searchsorted(side):
+    rng = np.random.default_rng(0)
+    xdata = np.sort(rng.integers(0, 50, size=300)).astype(float)
+
+    idx = 0 if side == "left" else xdata.shape[0]
+    for _ in range(2000):
+        if rng.random() < 0.5:
+            value = rng.choice(xdata)
+        else:
+            value = rng.uniform(-5.0, 55.0)
+
+        idx = array_utils.walk_sorted_index(
+            xdata=xdata, value=value, idx=idx, side=side
+        )
+        assert idx == np.searchsorted(xdata, value, side=side)
+
+
+@pytest.mark.parametrize("side", ["left", "right"])
+def test_walk_sorted_index_small_steps(side):
+    xdata = np.arange(100.0)
+
+    idx = int(np.searchsorted(xdata, 50.0, side=side))
+    for value in [50.5, 51.0, 52.0, 51.5, 49.0, 49.0]:
+        idx = array_utils.walk_sorted_index(
+            xdata=xdata, value=value, idx=idx, side=side
+        )
+        assert idx == np.searchsorted(xdata, value, side=side)
+
+
+def test_stack_arrays_drops_leading_empty_arrays():
+    array_list = [
+        np.array([]),
+        np.array([]),
+        np.array([1.0, 2.0]),
+        np.array([3.0, 4.0]),
+    ]
+
+    stacked = array_utils.stack_arrays(array_list)
+
+    np.testing.assert_array_equal(stacked, [[1.0, 2.0], [3.0, 4.0]])
+
+
+def test_stack_arrays_fills_later_empty_arrays():
+    array_list = [np.ones((2, 2)), np.array([]), np.zeros((2, 2))]
+
+    stacked = array_utils.stack_arrays(array_list)
+
+    assert stacked.shape == (3, 2, 2)
+    np.testing.assert_array_equal(stacked[1], np.full((2, 2), -1717.0))
+    np.testing.assert_array_equal(stacked[0], np.ones((2, 2)))
+    np.testing.assert_array_equal(stacked[2], np.zeros((2, 2)))
+
+
+def test_stack_arrays_all_empty():
+    assert array_utils.stack_arrays([np.array([]), np.array([])]) is None
+
+
+def test_stack_arrays_single_array():
+    array_list = [np.array([]), np.array([1.0, 2.0])]
+
+    stacked = array_utils.stack_arrays(array_list)
+    unstacked = array_utils.stack_arrays(array_list, stack_single=False)
+
+    assert stacked.shape == (1, 2)
+    assert unstacked.shape == (2,)
+
+
+def test_combine_time_stamps_rounding():
+    stamp_list = [(0, 0), (1, 1), (1_700_000_000, 123_456_789), (42, 999_999_999)]
+
+    stamps = array_utils.combine_time_stamps(stamp_list)
+
+    assert stamps.dtype == np.float64
+    assert stamps.tolist() == [sec + nsec * 1e-9 for sec, nsec in stamp_list]
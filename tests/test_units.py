@@ -0,0 +1,16 @@
+import pytest
+
+from python_data_parsers import units
+
+
+@pytest.mark.parametrize(
+    "name, value, expected",
+    [
+        ("dist_kilom", 2.0, (2000.0, "dist_m")),
+        ("x_rad", 3.0, (3.0, "x_rad")),
+        ("t_mili_s", 5.0, (0.005, "t__s")),
+        ("decision_mili_s", 1.0, (0.001, "decision__s")),
+    ],
+)
+def test_si_prefix_to_base_from_str(name, value, expected):
+    assert units.si_prefix_to_base_from_str(name=name, value=value) == expected